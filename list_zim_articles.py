@@ -4,7 +4,9 @@ Simple script to list articles contained in a ZIM file.
 Uses libzim to read ZIM archives.
 """
 
+import codecs
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import warnings
@@ -21,100 +23,175 @@ except ImportError:
     print("Please install it with: uv pip install libzim")
     sys.exit(1)
 
+TITLE_CACHE_SIZE = 4096
+SUGGESTION_CACHE_SIZE = 16
+QUERY_CACHE_SIZE = 64
+DUMP_CHUNK_SIZE = 1 << 16
+
+# Non text/* mimetypes that are still dumped as text
+_TEXT_MIMES = frozenset({
+    'application/javascript',
+    'application/json',
+    'application/xml',
+    'image/svg+xml',
+})
+
+# Archive objects are not hashable, so the caches below are keyed by id() and
+# this registry keeps each archive alive (and its id unique) while cached.
+_archives: dict[int, Archive] = {}
+
+
+def _archive_id(archive: Archive) -> int:
+    _archives.setdefault(id(archive), archive)
+    return id(archive)
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _cached_title(archive_id: int, path: str) -> str:
+    entry = _archives[archive_id].get_entry_by_path(path)
+    return entry.title or "(no title)"
+
+
+def _get_title(archive: Archive, path: str) -> str:
+    """Return the title of the entry at path, caching repeated lookups."""
+    return _cached_title(_archive_id(archive), path)
+
+
+@lru_cache(maxsize=None)
+def _cached_suggestion_searcher(archive_id: int) -> SuggestionSearcher:
+    return SuggestionSearcher(_archives[archive_id])
+
+
+@lru_cache(maxsize=SUGGESTION_CACHE_SIZE)
+def _cached_suggestion(archive_id: int, query: str):
+    return _cached_suggestion_searcher(archive_id).suggest(query)
+
+
+def _get_suggestion(archive: Archive, query: str):
+    """Return the suggestion search for query, reusing it across pagination."""
+    return _cached_suggestion(_archive_id(archive), query)
+
+
+@lru_cache(maxsize=None)
+def _cached_searcher(archive_id: int) -> Searcher:
+    return Searcher(_archives[archive_id])
+
+
+def _get_searcher(archive: Archive) -> Searcher:
+    """Return the fulltext searcher for archive, creating it once."""
+    return _cached_searcher(_archive_id(archive))
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _make_query(query: str) -> Query:
+    """Return a fulltext Query for query, reusing it for repeated searches."""
+    q = Query()
+    q.set_query(query)
+    return q
+
+
+def _trunc(text: str, width: int) -> str:
+    """Truncate text to width with a trailing ellipsis, or pad it to width."""
+    return text[:width - 3] + '...' if len(text) > width else text.ljust(width)
+
+
+# Truncated columns are already padded, so rows only need joining
+_format_row = "{} {}".format
+
 
 def show_archive_info(archive: Archive):
     """Display general information about the ZIM archive."""
-    print("=" * 80)
-    print("ZIM Archive Information")
-    print("=" * 80)
-    print(f"Filename: {archive.filename}")
-    print(f"File size: {archive.filesize / (1024*1024):.2f} MB")
-    print(f"UUID: {archive.uuid}")
-    print(f"Has main entry: {archive.has_main_entry}")
+    has_illustration = archive.has_illustration()
+    lines = [
+        "=" * 80,
+        "ZIM Archive Information",
+        "=" * 80,
+        f"Filename: {archive.filename}",
+        f"File size: {archive.filesize / (1024*1024):.2f} MB",
+        f"UUID: {archive.uuid}",
+        f"Has main entry: {archive.has_main_entry}",
+    ]
     if archive.has_main_entry:
-        print(f"Main entry: {archive.main_entry.path}")
-    print(f"Entry count: {archive.entry_count}")
-    print(f"All entry count: {archive.all_entry_count}")
-    print(f"Article count: {archive.article_count}")
-    print(f"Media count: {archive.media_count}")
-    print(f"Has fulltext index: {archive.has_fulltext_index}")
-    print(f"Has title index: {archive.has_title_index}")
-    print(f"Has checksum: {archive.has_checksum}")
-    print(f"Has illustration: {archive.has_illustration()}")
-    if archive.has_illustration():
+        lines.append(f"Main entry: {archive.main_entry.path}")
+    lines += [
+        f"Entry count: {archive.entry_count}",
+        f"All entry count: {archive.all_entry_count}",
+        f"Article count: {archive.article_count}",
+        f"Media count: {archive.media_count}",
+        f"Has fulltext index: {archive.has_fulltext_index}",
+        f"Has title index: {archive.has_title_index}",
+        f"Has checksum: {archive.has_checksum}",
+        f"Has illustration: {has_illustration}",
+    ]
+    if has_illustration:
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", DeprecationWarning)
             sizes = archive.get_illustration_sizes()
-        print(f"  Illustration sizes: {sizes}")
-    print()
+        lines.append(f"  Illustration sizes: {sizes}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
-def list_by_suggestion(archive: Archive, query: str = "", limit: int = 100):
-    """List articles using the suggestion search."""
-    if not query:
-        # Use a wildcard approach - iterate through common starting characters
-        print("Note: Empty prefix returns no results. Using search for 'a' as example.")
-        print("Use 'list <prefix>' to search with a specific prefix.")
-        query = "a"
+def _print_results(archive: Archive, results, summary_suffix: str = "") -> int:
+    """Print a table of result paths and titles.
     
-    searcher = SuggestionSearcher(archive)
-    suggestion = searcher.suggest(query)
-    results = suggestion.getResults(0, limit)
+    Args:
+        archive: The ZIM archive
+        results: Iterable of entry paths
+        summary_suffix: Text appended to the "Shown" summary line
     
+    Returns:
+        The number of entries shown
+    """
     count = 0
-    print(f"{'Path':<60} {'Title':<40}")
-    print("-" * 100)
+    rows = [f"{'Path':<60} {'Title':<40}", "-" * 100]
     
+    # Bind per-row callables as locals to skip repeated global/attribute lookups
+    get_title, trunc, format_row, append = _get_title, _trunc, _format_row, rows.append
     for path in results:
         try:
-            entry = archive.get_entry_by_path(path)
-            title = entry.title or "(no title)"
-            path_display = (path[:57] + '...') if len(path) > 60 else path
-            title_display = (title[:37] + '...') if len(title) > 40 else title
-            print(f"{path_display:<60} {title_display:<40}")
+            title = get_title(archive, path)
+            append(format_row(trunc(path, 60), trunc(title, 40)))
             count += 1
         except Exception as e:
-            print(f"{path:<60} (error: {e})")
+            append(f"{path:<60} (error: {e})")
     
-    print("-" * 100)
-    print(f"Shown: {count} articles")
+    append("-" * 100)
+    append(f"Shown: {count} articles{summary_suffix}")
+    # Emit the whole table in one write instead of one print() per row
+    sys.stdout.write("\n".join(rows) + "\n")
+    sys.stdout.flush()
     return count
 
 
+def list_by_suggestion(archive: Archive, query: str = "", limit: int = 100):
+    """List articles using the suggestion search."""
+    if not query:
+        # Use a wildcard approach - iterate through common starting characters
+        print("Note: Empty prefix returns no results. Using search for 'a' as example.")
+        print("Use 'list <prefix>' to search with a specific prefix.")
+        query = "a"
+    
+    suggestion = _get_suggestion(archive, query)
+    results = suggestion.getResults(0, limit)
+    return _print_results(archive, results)
+
+
 def search_articles(archive: Archive, query: str, offset: int = 0, limit: int = 50):
     """Search for articles using fulltext search."""
     if not archive.has_fulltext_index:
         print("Archive does not have a fulltext index.")
         return 0
     
-    searcher = Searcher(archive)
-    q = Query()
-    q.set_query(query)
-    search = searcher.search(q)
+    searcher = _get_searcher(archive)
+    search = searcher.search(_make_query(query))
     
     estimated = search.getEstimatedMatches()
     print(f"Estimated matches: {estimated}")
     
     results = search.getResults(offset, limit)
-    
-    count = 0
-    print(f"{'Path':<60} {'Title':<40}")
-    print("-" * 100)
-    
-    for path in results:
-        try:
-            entry = archive.get_entry_by_path(path)
-            title = entry.title or "(no title)"
-            path_display = (path[:57] + '...') if len(path) > 60 else path
-            title_display = (title[:37] + '...') if len(title) > 40 else title
-            print(f"{path_display:<60} {title_display:<40}")
-            count += 1
-        except Exception as e:
-            print(f"{path:<60} (error: {e})")
-    
-    print("-" * 100)
-    print(f"Shown: {count} articles (offset: {offset})")
-    return count
+    return _print_results(archive, results, f" (offset: {offset})")
 
 
 def get_entry_details(archive: Archive, path: str):
@@ -155,26 +232,31 @@ def dump_entry_content(archive: Archive, path: str, output_path: str | None = No
             entry = redirect
         
         item = entry.get_item()
-        content = item.content.tobytes()
+        # memoryview over the blob - written in slices rather than copied
+        content = item.content
         
         # Try to decode as text if it's a text type
         mimetype = item.mimetype
-        is_text = mimetype.startswith('text/') or mimetype in ('application/javascript', 'application/json')
+        is_text = mimetype.startswith('text/') or mimetype in _TEXT_MIMES
         
         if output_path:
             # Write to file
-            mode = 'w' if is_text else 'wb'
-            with open(output_path, mode) as f:
-                if is_text:
-                    f.write(content.decode('utf-8', errors='replace'))
-                else:
-                    f.write(content)
+            if is_text:
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                with open(output_path, 'w') as f:
+                    for start in range(0, len(content), DUMP_CHUNK_SIZE):
+                        f.write(decoder.decode(content[start:start + DUMP_CHUNK_SIZE]))
+                    f.write(decoder.decode(b'', final=True))
+            else:
+                with open(output_path, 'wb') as f:
+                    for start in range(0, len(content), DUMP_CHUNK_SIZE):
+                        f.write(content[start:start + DUMP_CHUNK_SIZE])
             print(f"Dumped {len(content)} bytes to '{output_path}' ({mimetype})")
         else:
             # Output to stdout
             if is_text:
                 try:
-                    text = content.decode('utf-8')
+                    text = str(content, 'utf-8')
                     print(text)
                 except UnicodeDecodeError:
                     # Fall back to binary output info
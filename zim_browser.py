@@ -3,60 +3,637 @@
 ZIM Browser TUI - A textual-based browser for ZIM archives.
 """
 
+import multiprocessing
+import os
+import re
+import sqlite3
 import sys
+import threading
 import warnings
 import webbrowser
 import posixpath
-from collections import OrderedDict
-from typing import Any, TypeAlias
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, TypeAlias
 from pathlib import Path
 from urllib.parse import unquote
 
 ArticleEntry: TypeAlias = tuple[str, str]  # (path, title)
+HistoryEntry: TypeAlias = tuple[str, str, "Entry | None"]  # (path, title, resolved entry)
 
-MARKDOWN_CACHE_SIZE = 50
+RENDER_CACHE_SIZE = 50
+HISTORY_SIZE = 256  # oldest entries are dropped past this
+MAX_REDIRECT_HOPS = 8
+SUGGESTION_CACHE_SIZE = 4
 BATCH_SIZE = 100
+SIDEBAR_CHUNK_SIZE = 20
 LAZY_LOAD_THRESHOLD = 10
+LAZY_LOAD_DELAY = 0.08  # seconds the highlight must settle before loading more
+PREFETCH_DELAY = 0.05  # seconds the highlight must settle before prefetching
+SEARCH_DELAY = 0.12  # seconds between the last search submission and running it
+TITLE_CACHE_DIR = Path.home() / ".cache" / "zimbrowser"
+SQLITE_MAX_PARAMS = 500
 
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="libzim")
 
 try:
-    from libzim.reader import Archive
+    from libzim.reader import Archive, Entry
     from libzim.suggestion import SuggestionSearcher
 except ImportError:
     print("Error: libzim is not installed. Run: uv pip install libzim")
     sys.exit(1)
 
 try:
-    from markdownify import markdownify as md
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
 except ImportError:
-    print("Error: markdownify is not installed. Run: uv pip install markdownify")
+    print("Error: selectolax is not installed. Run: uv pip install selectolax")
     sys.exit(1)
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.widgets import (
-    Markdown,
+    Static,
     Input,
-    ListView,
-    ListItem,
+    OptionList,
     Label,
     Header,
     Footer,
 )
+from textual.content import Content, Span
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.reactive import reactive
 from textual.binding import Binding
 from textual.message import Message
+from textual.style import Style
+from textual.timer import Timer
+from textual.worker import get_current_worker
 
 
-class ArticleList(ListView):
-    """List widget for displaying articles."""
+SKIP_TAGS = frozenset({"head", "script", "style", "noscript", "template", "link", "meta", "button"})
+BLOCK_TAGS = frozenset({
+    "p", "div", "section", "article", "main", "header", "footer", "aside", "nav",
+    "figure", "figcaption", "details", "summary", "dl", "dt", "dd", "center", "caption",
+})
+HEADING_STYLES = {
+    "h1": "bold underline $text-accent", "h2": "bold $text-accent", "h3": "bold $text-primary",
+    "h4": "bold", "h5": "bold", "h6": "bold $text-muted",
+}
+EMPHASIS_STYLES = {
+    "strong": "bold", "b": "bold", "em": "italic", "i": "italic",
+    "del": "strike", "s": "strike", "u": "underline",
+}
+CODE_STYLE = "$text-warning"
+PRE_STYLE = "$text-secondary"
+RULE_WIDTH = 40
+TABLE_SECTION_TAGS = frozenset({"thead", "tbody", "tfoot"})
+
+HTML_MIMES = ("text/html", "application/xhtml+xml")
+TEXT_MIMES = frozenset({"application/javascript", "application/json", "application/xml", "image/svg+xml"})
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Either an external scheme prefix, or the internal path without leading slashes, query and fragment
+_LINK_RE = re.compile(r"(?P<external>https?://|//)|/*(?P<path>[^?#]*)")
+_SCRIPT_STYLE_RE = re.compile(rb"<(script|style)\b[^>]*>.*?</\1\s*>", re.S | re.I)
+_MAIN_END_RE = re.compile(rb"</main\s*>", re.I)
+
+RELATIVE_LINK_PREFIXES = ("../", "./")
+# Bell, backspace, vertical tab, form feed and carriage return, which would disturb the terminal
+_CONTROL_CODE_RE = re.compile("[\x07\x08\x0b\x0c\r]")
+
+
+class _ContentWriter:
+    """Single-pass converter from a selectolax node tree to styled Content.
+
+    Text is appended to one buffer and styles are recorded as spans over it,
+    so the result can be shown directly without another parsing stage.
+    """
+    
+    _HANDLERS: dict[str, Callable[["_ContentWriter", LexborNode], None]]
+    
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._spans: list[Span] = []
+        self._position = 0
+        # Prefixes for lines inside lists and quotes, and a list marker waiting for its first line
+        self._prefixes: list[str] = []
+        self._marker: str | None = None
+        self._list_depth = 0
+        # Line breaks are held back until more text follows, so blocks never
+        # leave trailing gaps; a pending count of 2 means a blank line
+        self._pending_breaks = 0
+        self._gap = ""
+        self._line_start = True
+        self._space = True
+        # Where text actually starts after breaks and prefixes written at a position,
+        # so spans opened before them don't cover the line break or a list marker
+        self._text_starts: dict[int, int] = {}
+    
+    @classmethod
+    def _build_handlers(cls) -> dict[str, Callable[["_ContentWriter", LexborNode], None]]:
+        # Built once for the class, since table cells each get their own writer
+        handlers = dict.fromkeys(SKIP_TAGS, cls._skip)
+        handlers.update(dict.fromkeys(BLOCK_TAGS, cls._block_tag))
+        handlers.update(dict.fromkeys(HEADING_STYLES, cls._heading))
+        handlers.update(dict.fromkeys(EMPHASIS_STYLES, cls._emphasis))
+        handlers.update({
+            "a": cls._link,
+            "img": cls._image,
+            "br": cls._line_break,
+            "hr": cls._rule,
+            "code": cls._code,
+            "pre": cls._pre,
+            "ul": cls._list,
+            "ol": cls._list,
+            "blockquote": cls._blockquote,
+            "table": cls._table,
+        })
+        return handlers
+    
+    def convert(self, root: LexborNode) -> Content:
+        self._children(root)
+        return self._content()
+    
+    def _content(self) -> Content:
+        # Control codes become spaces rather than being stripped, which would shift the spans
+        text = _CONTROL_CODE_RE.sub(" ", "".join(self._parts).rstrip())
+        end = len(text)
+        spans = [span if span.end <= end else Span(span.start, end, span.style) for span in self._spans]
+        return Content(text, spans, strip_control_codes=False)
+    
+    def _children(self, node: LexborNode) -> None:
+        render = self._node
+        for child in node.iter(include_text=True):
+            render(child)
+    
+    def _node(self, node: LexborNode) -> None:
+        tag = node.tag
+        if tag == "-text":
+            self._text(node.text_content)
+            return
+        handler = self._HANDLERS.get(tag)
+        if handler is not None:
+            handler(self, node)
+        elif not tag.startswith("-"):  # Skip comments and other non-element nodes
+            self._children(node)
+    
+    def _write(self, text: str) -> None:
+        if not text:
+            return
+        begin = self._position
+        if self._pending_breaks:
+            self._newline()
+            if self._pending_breaks > 1:
+                self._append(self._gap)
+                self._newline()
+            self._pending_breaks = 0
+        if self._line_start:
+            prefix = "".join(self._prefixes)
+            if self._marker is not None:
+                prefix = prefix[:-len(self._marker)] + self._marker
+                self._marker = None
+            self._append(prefix)
+        if self._position > begin:
+            self._text_starts[begin] = self._position
+        self._parts.append(text)
+        self._position += len(text)
+        self._line_start = False
+        self._space = text[-1] == " "
+    
+    def _append(self, text: str) -> None:
+        if text:
+            self._parts.append(text)
+            self._position += len(text)
+    
+    def _text(self, text: str) -> None:
+        text = _WHITESPACE_RE.sub(" ", text)
+        if self._space and text.startswith(" "):
+            text = text[1:]
+        self._write(text)
+    
+    def _newline(self) -> None:
+        self._append("\n")
+        self._line_start = True
+        self._space = True
+    
+    def _break(self, count: int = 1) -> None:
+        if not self._position:
+            return
+        # Blank lines keep the quote bars that surround them on both sides
+        gap = "".join(self._prefixes).rstrip()
+        self._gap = posixpath.commonprefix([self._gap, gap]) if self._pending_breaks else gap
+        self._pending_breaks = max(self._pending_breaks, count)
+        self._space = True
+    
+    def _block_break(self) -> None:
+        # Blocks inside list items are only separated by a line break
+        self._break(1 if self._list_depth else 2)
+    
+    def _styled(self, node: LexborNode, style: str | Style) -> None:
+        start = self._position
+        self._children(node)
+        self._span(start, style)
+    
+    def _span(self, start: int, style: str | Style) -> None:
+        start = self._text_starts.get(start, start)
+        if self._position > start:
+            self._spans.append(Span(start, self._position, style))
+    
+    def _skip(self, node: LexborNode) -> None:
+        pass
+    
+    def _block_tag(self, node: LexborNode) -> None:
+        self._block_break()
+        self._children(node)
+        self._block_break()
+    
+    def _heading(self, node: LexborNode) -> None:
+        self._block_break()
+        self._styled(node, HEADING_STYLES[node.tag])
+        self._block_break()
+    
+    def _emphasis(self, node: LexborNode) -> None:
+        self._styled(node, EMPHASIS_STYLES[node.tag])
+    
+    def _link(self, node: LexborNode) -> None:
+        href = node.attributes.get("href")
+        if not href:
+            self._children(node)
+            return
+        self._styled(node, Style.from_meta({"@click": f"app.follow_link({href!r})"}))
+    
+    def _image(self, node: LexborNode) -> None:
+        src = node.attributes.get("src")
+        if not src:
+            return
+        start = self._position
+        self._text(f"🖼 {node.attributes.get('alt') or ''} ")
+        self._span(start, Style.from_meta({"@click": f"app.follow_link({src!r})"}))
+    
+    def _line_break(self, node: LexborNode) -> None:
+        self._break(self._pending_breaks + 1)
+    
+    def _rule(self, node: LexborNode) -> None:
+        self._block_break()
+        start = self._position
+        self._write("─" * RULE_WIDTH)
+        self._span(start, "$text-muted")
+        self._block_break()
+    
+    def _code(self, node: LexborNode) -> None:
+        start = self._position
+        self._text(node.text(deep=True))
+        self._span(start, CODE_STYLE)
+    
+    def _pre(self, node: LexborNode) -> None:
+        self._block_break()
+        start = self._position
+        lines = node.text(deep=True).strip("\n").split("\n")
+        for i, line in enumerate(lines):
+            if i:
+                self._newline()
+            self._write(line)
+        self._span(start, PRE_STYLE)
+        self._block_break()
+    
+    def _blockquote(self, node: LexborNode) -> None:
+        self._block_break()
+        self._prefixes.append("▌ ")
+        start = self._position
+        self._children(node)
+        self._span(start, "italic")
+        self._prefixes.pop()
+        self._block_break()
+    
+    def _list(self, node: LexborNode) -> None:
+        ordered = node.tag == "ol"
+        number = 1
+        self._block_break()
+        self._list_depth += 1
+        for child in node.iter():
+            if child.tag != "li":
+                continue
+            marker = f"{number}. " if ordered else "• "
+            number += 1
+            self._break(1)
+            self._prefixes.append(" " * len(marker))
+            self._marker = marker
+            self._children(child)
+            self._marker = None
+            self._prefixes.pop()
+        self._list_depth -= 1
+        self._block_break()
+    
+    def _table(self, node: LexborNode) -> None:
+        rows = []
+        for row in self._rows(node):
+            cells = [self._cell(cell) for cell in row.iter() if cell.tag in ("th", "td")]
+            if cells:
+                rows.append(cells)
+        if not rows:
+            return
+        width = max(len(cells) for cells in rows)
+        for cells in rows:
+            cells += [Content()] * (width - len(cells))
+        widths = [max(row[column].cell_length for row in rows) for column in range(width)]
+        
+        self._block_break()
+        for i, cells in enumerate(rows):
+            if i:
+                self._newline()
+            for column, cell in enumerate(cells):
+                if column:
+                    self._write(" │ ")
+                self._write_content(cell, widths[column], header=i == 0)
+            if i == 0 and len(rows) > 1:
+                self._newline()
+                self._write("─┼─".join("─" * column_width for column_width in widths))
+        self._block_break()
+    
+    def _rows(self, table: LexborNode) -> list[LexborNode]:
+        # Only the table's own rows; rows of nested tables are rendered with their cell
+        rows = []
+        for child in table.iter():
+            if child.tag == "tr":
+                rows.append(child)
+            elif child.tag in TABLE_SECTION_TAGS:
+                rows.extend(row for row in child.iter() if row.tag == "tr")
+        return rows
+    
+    def _cell(self, cell: LexborNode) -> Content:
+        writer = _ContentWriter()
+        writer._children(cell)
+        content = writer._content()
+        # Cells are kept to one line; replacing newlines keeps the span offsets
+        return Content(content.plain.replace("\n", " "), list(content.spans), strip_control_codes=False)
+    
+    def _write_content(self, content: Content, width: int, header: bool = False) -> None:
+        self._write(content.plain + " " * (width - content.cell_length) or " ")
+        # The line prefix may have been written first, so offset from the text itself
+        offset = self._position - len(self._parts[-1])
+        self._spans.extend(Span(span.start + offset, span.end + offset, span.style) for span in content.spans)
+        if header and content.plain:
+            self._spans.append(Span(offset, offset + len(content.plain), "bold"))
+
+
+_ContentWriter._HANDLERS = _ContentWriter._build_handlers()
+
+
+def html_to_content(html: str | bytes) -> Content:
+    """Convert an HTML document to styled Content for the content view.
+
+    Args:
+        html: The HTML source, as text or raw bytes.
+
+    Returns:
+        The rendering of the document body.
+    """
+    tree = LexborHTMLParser(html)
+    root = tree.body or tree.root
+    if root is None:
+        return Content()
+    return _ContentWriter().convert(root)
+
+
+def message_content(title: str, body: str = "") -> Content:
+    """Build the content for a status message such as an error.
+
+    Args:
+        title: The heading to show.
+        body: Text to show below the heading.
+
+    Returns:
+        The message content.
+    """
+    heading = Content.styled(title, HEADING_STYLES["h1"])
+    return Content.assemble(heading, "\n\n", body) if body else heading
+
+
+def strip_page_chrome(html: bytes | memoryview) -> bytes:
+    """Drop markup the converter would discard before it gets parsed.
+
+    Removes script and style elements and anything after the last closing
+    main tag, so an earlier nested main can't truncate the article. A
+    memoryview is only sliced, so the result is the one copy made.
+
+    Args:
+        html: The raw HTML bytes.
+
+    Returns:
+        The trimmed HTML bytes.
+    """
+    end = None
+    for end in _MAIN_END_RE.finditer(html):
+        pass
+    if end is not None:
+        html = html[:end.start()]
+    return _SCRIPT_STYLE_RE.sub(b"", html)
+
+
+def item_to_content(mimetype: str, content: memoryview) -> Content:
+    """Render a ZIM item for the content view based on its mimetype.
+
+    Only HTML goes through the HTML converter; other text is shown verbatim
+    and binary content is not decoded at all.
+
+    Args:
+        mimetype: The item's mimetype.
+        content: The item's raw content.
+
+    Returns:
+        The content to display for the item.
+    """
+    if mimetype.startswith(HTML_MIMES):
+        # Strip straight from the memoryview; the parser decodes the UTF-8 bytes itself
+        return html_to_content(strip_page_chrome(content))
+    if mimetype.startswith("text/") or mimetype in TEXT_MIMES:
+        return Content.styled(str(content, "utf-8", "replace"), PRE_STYLE)
+    return Content.styled(f"Binary content ({mimetype}, {len(content)} bytes) is not displayed.", "italic")
+
+
+def resolve_redirects(entry: Entry) -> Entry:
+    """Follow a chain of redirects to the entry holding the content.
+
+    Args:
+        entry: The entry to resolve.
+
+    Returns:
+        The first entry in the chain that isn't a redirect.
+
+    Raises:
+        ValueError: If the chain loops or is longer than MAX_REDIRECT_HOPS.
+    """
+    start = entry.path
+    visited = {start}
+    for _ in range(MAX_REDIRECT_HOPS):
+        if not entry.is_redirect:
+            return entry
+        entry = entry.get_redirect_entry()
+        if entry.path in visited:
+            raise ValueError(f"Redirect loop at {entry.path}")
+        visited.add(entry.path)
+    if entry.is_redirect:
+        raise ValueError(f"Too many redirects from {start}")
+    return entry
+
+
+_worker_archive: Archive | None = None
+
+
+def _init_render_worker(zim_path: str) -> None:
+    """Open the archive once in each render process.
+
+    Args:
+        zim_path: The path to the ZIM file.
+    """
+    global _worker_archive
+    _worker_archive = Archive(zim_path)
+
+
+def _render_in_worker(path: str) -> Content:
+    """Convert an article in a render process.
+
+    Args:
+        path: The path to a non-redirect entry.
+
+    Returns:
+        The content to display for the entry's item.
+    """
+    item = _worker_archive.get_entry_by_path(path).get_item()
+    return item_to_content(item.mimetype, item.content)
+
+
+def prefetch_file(path: Path) -> None:
+    """Ask the kernel to start reading a file into the page cache.
+
+    This is only a hint, so it's skipped where posix_fadvise is unavailable
+    and any error is ignored.
+
+    Args:
+        path: The file to prefetch.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, os.fstat(fd).st_size, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class TitleStore:
+    """Persistent path -> title cache for one archive, stored in sqlite.
+
+    Lookups hit the local database before falling back to libzim, so titles
+    seen in earlier sessions don't need a dirent lookup. If the cache file
+    can't be opened the store stays disabled and every call is a no-op.
+
+    The connection is shared by the sidebar's load workers, and a cancelled
+    worker can still be using it when the next one starts, so every use of
+    it is serialized by a lock. The database is only opened on first use,
+    which happens in a load worker, so the disk I/O stays off the event loop.
+    """
+    
+    def __init__(self, archive: Archive, cache_dir: Path = TITLE_CACHE_DIR) -> None:
+        self._path = cache_dir / f"{archive.uuid}.sqlite"
+        self._conn: sqlite3.Connection | None = None
+        self._opened = False
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open the database on first use; the caller must hold the lock.
+
+        Returns:
+            The connection, or None if the store is disabled or closed.
+        """
+        if self._opened:
+            return self._conn
+        self._opened = True
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS titles(path TEXT PRIMARY KEY, title TEXT NOT NULL)"
+            )
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            pass  # Run without the persistent cache
+        return self._conn
+    
+    def get_many(self, paths: list[str]) -> dict[str, str]:
+        """Look up cached titles.
+
+        Args:
+            paths: The entry paths to look up.
+
+        Returns:
+            A mapping of path to title for every path found in the cache.
+        """
+        found: dict[str, str] = {}
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return found
+            try:
+                for start in range(0, len(paths), SQLITE_MAX_PARAMS):
+                    chunk = paths[start:start + SQLITE_MAX_PARAMS]
+                    placeholders = ",".join("?" * len(chunk))
+                    found.update(conn.execute(
+                        f"SELECT path, title FROM titles WHERE path IN ({placeholders})", chunk
+                    ))
+            except sqlite3.Error:
+                pass
+        return found
+    
+    def put_many(self, rows: list[tuple[str, str]]) -> None:
+        """Store titles in a single transaction.
+
+        Args:
+            rows: (path, title) tuples.
+        """
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    # Columns are named so stores written with the old redirect column still work
+                    conn.executemany("INSERT OR REPLACE INTO titles(path, title) VALUES (?, ?)", rows)
+            except sqlite3.Error:
+                pass
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            # A closed store stays closed, even if a late worker still calls it
+            self._opened = True
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ArticleList(OptionList):
+    """List widget for displaying articles.
+
+    OptionList renders only the visible rows, so deep lazy-loaded listings
+    don't mount a widget per article.
+    """
     
     BINDINGS = [
         Binding("j", "cursor_down", "Down"),
         Binding("k", "cursor_up", "Up"),
-        Binding("g", "cursor_top", "Top"),
-        Binding("G", "cursor_bottom", "Bottom"),
+        Binding("g", "first", "Top"),
+        Binding("G", "last", "Bottom"),
         Binding("down", "cursor_down", "Down"),
         Binding("up", "cursor_up", "Up"),
     ]
@@ -79,15 +656,15 @@ class ContentView(VerticalScroll):
     
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.markdown = Markdown(id="markdown-content")
+        self.article = Static(id="article-content")
         self.can_focus = True
     
     def compose(self) -> ComposeResult:
-        yield self.markdown
+        yield self.article
     
-    def update(self, content: str) -> None:
-        """Update the markdown content."""
-        self.markdown.update(content)
+    def update(self, content: Content) -> None:
+        """Update the article content."""
+        self.article.update(content)
     
     def action_scroll_down(self) -> None:
         """Scroll down one line."""
@@ -160,11 +737,25 @@ class Sidebar(Vertical):
     def __init__(self, archive: Archive) -> None:
         self.archive = archive
         self.suggestion_searcher = SuggestionSearcher(archive)
-        self.all_articles: list[ArticleEntry] = []
+        self._suggestions: OrderedDict[str, Any] = OrderedDict()
+        # Parallel lists (path and title per row) rather than a list of tuples
+        self.paths: list[str] = []
+        self.titles: list[str] = []
+        self._titles: dict[str, str] = {}
+        self.title_store = TitleStore(archive)
+        self._default_listing: tuple[int, list[str], list[str], bool] | None = None
         self.current_prefix: str = ""
         self.current_offset: int = 0
         self.batch_size: int = BATCH_SIZE
         self.has_more: bool = True
+        # Set while a batch worker runs; guards lazy loading and its debounce
+        self._loading: bool = False
+        self._generation: int = 0
+        self._capture_default: bool = False
+        self._search_lock = threading.Lock()
+        self._pending_load: Timer | None = None
+        self._search_timer: Timer | None = None
+        self._prefetch_timer: Timer | None = None
         super().__init__(id="sidebar")
     
     def compose(self) -> ComposeResult:
@@ -175,7 +766,11 @@ class Sidebar(Vertical):
     def on_mount(self) -> None:
         """Initialize the sidebar by loading initial articles."""
         self.load_articles("", BATCH_SIZE)
-        self.article_list.watch(self.article_list, "index", self._on_highlight_changed)
+        self.article_list.watch(self.article_list, "highlighted", self._on_highlight_changed)
+    
+    def on_unmount(self) -> None:
+        """Close the persistent title cache."""
+        self.title_store.close()
     
     def load_articles(self, prefix: str = "", limit: int = BATCH_SIZE) -> None:
         """Load articles from ZIM file.
@@ -184,76 +779,268 @@ class Sidebar(Vertical):
             prefix: The prefix to search for in article titles.
             limit: Maximum number of articles to load.
         """
-        if not prefix:
+        default = not prefix
+        if default:
             prefix = "a"
         
+        for timer in (self._pending_load, self._search_timer):
+            if timer is not None:
+                timer.stop()
+        self._pending_load = self._search_timer = None
+        
+        # Bumping the generation makes callbacks from any in-flight load stale
+        self._generation += 1
         self.current_prefix = prefix
         self.current_offset = 0
         self.batch_size = limit
         self.has_more = True
+        self._loading = False
         
-        self._load_batch(0, limit, clear=True)
+        # The default listing never changes, so rebuild it from the first snapshot
+        if default and self._default_listing is not None and self._default_listing[0] == limit:
+            self.workers.cancel_group(self, "sidebar")
+            self._restore_listing(*self._default_listing[1:])
+            return
+        
+        self._capture_default = default
+        self._start_batch(0, limit, clear=True)
+    
+    def _restore_listing(self, paths: list[str], titles: list[str], has_more: bool) -> None:
+        """Show a previously loaded first batch without querying libzim.
+
+        Args:
+            paths: The article paths of the batch.
+            titles: The matching article titles.
+            has_more: Whether more results follow the batch.
+        """
+        self.paths = list(paths)
+        self.titles = list(titles)
+        self.current_offset = len(paths)
+        self.has_more = has_more
+        self._show_titles(titles, clear=True)
     
-    def _load_batch(self, offset: int, limit: int, clear: bool = False) -> None:
-        """Load a batch of articles from the ZIM file.
+    def _show_titles(self, titles: list[str], clear: bool) -> None:
+        """Add list options for titles in a single screen update.
+
+        Args:
+            titles: The article titles to show.
+            clear: Whether to remove the existing options first.
+        """
+        # Clear and add the whole batch at once so Textual does a single layout pass
+        with self.app.batch_update():
+            if clear:
+                self.article_list.clear_options()
+            self.article_list.add_options([Content(title) for title in titles])
+            if clear and titles:
+                self.article_list.highlighted = 0
+    
+    def _start_batch(self, offset: int, limit: int, clear: bool = False) -> None:
+        """Start loading a batch, marking the sidebar busy until it finishes.
+
+        The flag is cleared by _finish_batch, or when a new listing replaces
+        the load, so lazy loads can't pile up behind a running worker.
 
         Args:
             offset: Starting position for loading articles.
             limit: Number of articles to load.
             clear: Whether to clear existing articles before loading.
         """
-        suggestion = self.suggestion_searcher.suggest(self.current_prefix)
-        results = suggestion.getResults(offset, limit)
+        self._loading = True
+        self._load_batch(self._generation, self.current_prefix, offset, limit, clear)
+    
+    @work(exclusive=True, thread=True, group="sidebar")
+    def _load_batch(
+        self, generation: int, prefix: str, offset: int, limit: int, clear: bool = False
+    ) -> None:
+        """Load a batch of articles from the ZIM file in a background worker.
+
+        Entries are streamed to the list in chunks of SIDEBAR_CHUNK_SIZE, so the
+        first screenful shows up before the whole batch has been resolved.
+
+        Args:
+            generation: The listing generation the batch was started for.
+            prefix: The prefix to search for in article titles.
+            offset: Starting position for loading articles.
+            limit: Number of articles to load.
+            clear: Whether to clear existing articles before loading.
+        """
+        worker = get_current_worker()
         
+        try:
+            with self._search_lock:
+                # Interned so the sidebar, title map, history and render cache share one copy
+                results = list(map(sys.intern, self._get_suggestion(prefix).getResults(offset, limit)))
+        except Exception:
+            results = []
+        
+        # Always send at least one chunk so a cleared list is emptied
+        for start in range(0, len(results) or 1, SIDEBAR_CHUNK_SIZE):
+            if worker.is_cancelled:
+                return
+            entries = self._resolve_titles(results[start:start + SIDEBAR_CHUNK_SIZE])
+            if worker.is_cancelled:
+                return
+            self.app.call_from_thread(self._add_entries, generation, entries, clear and start == 0)
+        
+        if not worker.is_cancelled:
+            # Advance by what libzim returned, so skipped entries don't shift the window
+            self.app.call_from_thread(
+                self._finish_batch, generation, offset + len(results), len(results) >= limit
+            )
+    
+    def _get_suggestion(self, prefix: str) -> Any:
+        """Get the suggestion search for a prefix, reusing recent ones.
+
+        Pagination only changes the result window, and the default listing and
+        the last few searches stay cached, so returning to them doesn't rebuild
+        the query.
+
+        Args:
+            prefix: The prefix to search for in article titles.
+
+        Returns:
+            The libzim suggestion search for prefix.
+        """
+        suggestion = self._suggestions.get(prefix)
+        if suggestion is None:
+            suggestion = self._suggestions[prefix] = self.suggestion_searcher.suggest(prefix)
+            if len(self._suggestions) > SUGGESTION_CACHE_SIZE:
+                self._suggestions.popitem(last=False)
+        else:
+            self._suggestions.move_to_end(prefix)
+        return suggestion
+    
+    def _add_entries(self, generation: int, entries: list[ArticleEntry], clear: bool) -> None:
+        """Append a streamed chunk of entries unless a newer load has started.
+
+        Args:
+            generation: The load generation the chunk belongs to.
+            entries: The (path, title) entries to add.
+            clear: Whether to clear existing articles first.
+        """
+        if generation != self._generation:
+            return
         if clear:
-            self.all_articles = []
-            self.article_list.clear()
+            self.paths = []
+            self.titles = []
+        paths = [path for path, _ in entries]
+        titles = [title for _, title in entries]
+        self.paths.extend(paths)
+        self.titles.extend(titles)
+        self._show_titles(titles, clear)
+    
+    def _finish_batch(self, generation: int, offset: int, has_more: bool) -> None:
+        """Record the end of a batch load unless a newer load has started.
+
+        Args:
+            generation: The load generation the batch belongs to.
+            offset: The offset to continue loading from.
+            has_more: Whether more results may follow.
+        """
+        if generation != self._generation:
+            return
+        self.current_offset = offset
+        self.has_more = has_more
+        self._loading = False
         
-        items = []
-        count = 0
+        if self._capture_default:
+            self._capture_default = False
+            self._default_listing = (self.batch_size, list(self.paths), list(self.titles), self.has_more)
+    
+    def _resolve_titles(self, paths: list[str]) -> list[ArticleEntry]:
+        """Resolve display titles for a batch of paths.
+
+        Titles come from the in-memory map, then the persistent store, and only
+        then from libzim; titles resolved through libzim are written back to
+        the store in one transaction.
+
+        Args:
+            paths: The paths to the articles in the ZIM archive.
+
+        Returns:
+            (path, title) entries in input order, skipping paths that can't be loaded.
+        """
+        titles = self._titles
+        missing = [path for path in paths if path not in titles]
+        if missing:
+            titles.update(self.title_store.get_many(missing))
         
-        for path in results:
+        new_rows = []
+        get_entry = self.archive.get_entry_by_path
+        for path in missing:
+            if path in titles:
+                continue
             try:
-                entry = self.archive.get_entry_by_path(path)
-                title = entry.title or path
-                self.all_articles.append((path, title))
-                items.append(ListItem(Label(title), name=path))
-                count += 1
+                entry = get_entry(path)
             except Exception:
-                pass  # Skip entries that can't be loaded - non-critical
+                continue  # Skip entries that can't be loaded - non-critical
+            title = titles[path] = entry.title or path
+            new_rows.append((path, title))
+        self.title_store.put_many(new_rows)
         
-        for item in items:
-            self.article_list.append(item)
-        
-        self.current_offset = offset + count
-        self.has_more = count >= limit
+        return [(path, titles[path]) for path in paths if path in titles]
     
     def load_more_articles(self) -> None:
         """Load more articles if available."""
-        if self.has_more:
-            self._load_batch(self.current_offset, self.batch_size)
+        self._pending_load = None
+        if not self.has_more or self._loading:
+            return
+        
+        # The list may have grown since the load was scheduled
+        index = self.article_list.highlighted
+        if index is None or index < len(self.paths) - LAZY_LOAD_THRESHOLD:
+            return
+        
+        self._start_batch(self.current_offset, self.batch_size)
     
     def _on_highlight_changed(self, new_index: int | None) -> None:
-        """Called when the highlighted item changes to trigger lazy loading near bottom.
+        """Called when the highlighted item changes to prefetch it and trigger lazy loading near bottom.
 
         Args:
             new_index: The new index of the highlighted item.
         """
-        if not self.has_more or new_index is None:
+        if new_index is None:
             return
         
-        list_size = len(self.all_articles)
+        self._schedule_prefetch(new_index)
+        
+        if not self.has_more or self._loading:
+            return
+        
+        list_size = len(self.paths)
         
         if list_size > 0 and new_index >= list_size - LAZY_LOAD_THRESHOLD:
-            self.load_more_articles()
+            # Debounce so holding a key down triggers one load for the final position
+            if self._pending_load is not None:
+                self._pending_load.stop()
+            self._pending_load = self.set_timer(LAZY_LOAD_DELAY, self.load_more_articles)
+    
+    def _schedule_prefetch(self, index: int) -> None:
+        """Prefetch the article at index once the highlight stops moving.
+
+        Args:
+            index: The index of the highlighted item.
+        """
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+        
+        if 0 <= index < len(self.paths):
+            path = self.paths[index]
+            self._prefetch_timer = self.set_timer(PREFETCH_DELAY, partial(self.app.prefetch_article, path))
     
     def search_articles(self, query: str) -> None:
         """Search for articles matching query.
 
+        Submissions are debounced, and starting a load cancels the previous
+        load worker, so only the latest query runs against libzim.
+
         Args:
             query: The search query prefix to match against article titles.
         """
-        self.load_articles(query, BATCH_SIZE)
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(SEARCH_DELAY, partial(self.load_articles, query, BATCH_SIZE))
     
     def get_selected_article(self) -> ArticleEntry | None:
         """Get the currently selected article path and title.
@@ -261,8 +1048,9 @@ class Sidebar(Vertical):
         Returns:
             A tuple of (path, title) for the selected article, or None if no article is selected.
         """
-        if self.article_list.index is not None and 0 <= self.article_list.index < len(self.all_articles):
-            return self.all_articles[self.article_list.index]
+        index = self.article_list.highlighted
+        if index is not None and 0 <= index < len(self.paths):
+            return self.paths[index], self.titles[index]
         return None
 
 
@@ -285,37 +1073,113 @@ class ZimBrowser(App):
         Binding("right", "history_forward", "Forward"),
     ]
     
-    def __init__(self, archive: Archive) -> None:
-        self.archive = archive
+    def __init__(self, zim_file: Path) -> None:
+        self.zim_file = zim_file
+        self.archive: Archive | None = None
         self.current_article_path: str = ""
-        self.history: list[ArticleEntry] = []
+        self.history: deque[HistoryEntry] = deque(maxlen=HISTORY_SIZE)
         self.history_index: int = -1
-        self._content_cache: OrderedDict[str, str] = OrderedDict()
+        self._content_cache: OrderedDict[str, Content] = OrderedDict()
+        self._redirects: OrderedDict[str, ArticleEntry] = OrderedDict()
+        # Created before the app runs, as the multiprocessing helpers need the
+        # real stdio descriptors; no processes start until the archive is open.
+        # Opened articles and prefetches get a process each, so opening an
+        # article never queues behind prefetches.
+        self._render_pool, self._prefetch_pool = (
+            ProcessPoolExecutor(
+                1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_render_worker,
+                initargs=(str(zim_file),),
+            )
+            for _ in range(2)
+        )
+        self._render_pool_ready = False
+        # The latest conversion submitted to each pool, cancelled once superseded
+        self._pool_lock = threading.Lock()
+        self._render_future: Future[Content] | None = None
+        self._prefetch_future: Future[Content] | None = None
+        self._prefetch_path: str | None = None
         super().__init__()
     
+    class ArchiveOpened(Message):
+        """Message sent when the ZIM archive has been opened."""
+        def __init__(self, archive: Archive) -> None:
+            self.archive = archive
+            super().__init__()
+    
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
-        
-        with Horizontal():
-            self.sidebar = Sidebar(self.archive)
-            yield self.sidebar
-            
-            self.content_view = ContentView(id="content")
-            yield self.content_view
-        
+        yield Label(f"Opening {self.zim_file.name}...", id="splash", classes="loading")
         yield Footer()
     
     def on_mount(self) -> None:
-        """Initialize the app and load the main page if available."""
+        """Start opening the archive behind the splash screen."""
+        self._open_archive()
+    
+    @work(thread=True, exit_on_error=False)
+    def _open_archive(self) -> None:
+        """Open the ZIM archive off the event loop, then warm the page cache.
+
+        Readahead starts once the archive is open, so it doesn't delay the
+        first screen but still gets ahead of the first searches. It's issued
+        before the render pool is warmed up, which waits on worker startup.
+        """
+        try:
+            archive = Archive(self.zim_file)
+        except Exception as e:
+            self.call_from_thread(self.exit, return_code=1, message=f"Error opening ZIM file: {e}")
+            return
+        self.post_message(self.ArchiveOpened(archive))
+        prefetch_file(self.zim_file)
+        self._start_render_pool()
+    
+    def _start_render_pool(self) -> None:
+        """Start the processes that convert articles outside this interpreter's GIL.
+
+        Workers are spawned rather than forked, since this process already runs
+        threads. The pool is only used once every worker is up, so the first
+        articles don't wait on interpreter startup; until then, and if the pool
+        can't start, conversion happens in the calling thread.
+        """
+        pools = (self._render_pool, self._prefetch_pool)
+        try:
+            for future in [pool.submit(int) for pool in pools]:
+                future.result()
+        except Exception:
+            for pool in pools:
+                pool.shutdown(wait=False, cancel_futures=True)
+            return
+        self._render_pool_ready = True
+    
+    def on_unmount(self) -> None:
+        """Stop the render processes."""
+        self._render_pool_ready = False
+        for pool in (self._render_pool, self._prefetch_pool):
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    async def on_zim_browser_archive_opened(self, message: ArchiveOpened) -> None:
+        """Replace the splash with the browser and load the main page if available."""
+        self.archive = message.archive
+        self.sidebar = Sidebar(self.archive)
+        self.content_view = ContentView(id="content")
+        
+        await self.query_one("#splash").remove()
+        await self.mount(Horizontal(self.sidebar, self.content_view), before=self.query_one(Footer))
+        
         self.sidebar.focus()
         try:
             if self.archive.has_main_entry:
                 main_entry = self.archive.main_entry
                 title = main_entry.title or "Main Page"
-                self.load_article(main_entry.path, title)
+                self._display_entry(main_entry, title)
         except Exception:
             pass
     
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        """Disable everything except quitting until the archive is open."""
+        return self.archive is not None or action == "quit"
+    
     def action_search(self) -> None:
         """Show search overlay."""
         if not list(self.query("#search-overlay")):
@@ -346,60 +1210,72 @@ class ZimBrowser(App):
         search_overlay = self.query_one("#search-overlay", SearchModal)
         search_overlay.remove()
     
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle article selection."""
         article = self.sidebar.get_selected_article()
         if article:
             path, title = article
             self.load_article(path, title)
     
-    def _normalize_href(self, href: str) -> str | None:
-        """Normalize an internal href to a ZIM path.
+    def _normalize_href(self, href: str) -> tuple[str | None, str | None]:
+        """Classify an href and normalize internal ones to a ZIM path.
 
         Args:
-            href: The href from the markdown link.
+            href: The href from the clicked link.
 
         Returns:
-            The normalized path, or None if the href is external.
+            A tuple of (external URL, ZIM path); exactly one is set for links
+            that can be followed, and both are None for unresolvable relative links.
         """
-        if href.startswith("http://") or href.startswith("https://") or href.startswith("//"):
-            return None
-        
-        path = href.lstrip("/")
-        path = unquote(path)
+        # One anchored match classifies the link and, for internal links, strips leading
+        # slashes and drops the query and fragment before unquoting so encoded "?"/"#"
+        # stay in the path
+        match = _LINK_RE.match(href)
+        scheme = match.group("external")
+        if scheme is not None:
+            return (f"https:{href}" if scheme == "//" else href), None
         
-        if "?" in path:
-            path = path.split("?")[0]
+        path = unquote(match.group("path"))
         
-        if "#" in path:
-            path = path.split("#")[0]
-        
-        if path.startswith("../") or path.startswith("./"):
+        if path.startswith(RELATIVE_LINK_PREFIXES):
             if not self.current_article_path:
-                return None
+                return None, None
             base_dir = posixpath.dirname(self.current_article_path)
             path = posixpath.normpath(posixpath.join(base_dir, path))
         
-        return path
+        return None, path
     
-    def on_markdown_link_clicked(self, event: Markdown.LinkClicked) -> None:
-        """Handle clicked links in article content."""
-        href = event.href
+    def action_follow_link(self, href: str) -> None:
+        """Follow a link clicked in article content.
 
-        if href.startswith("http://") or href.startswith("https://") or href.startswith("//"):
-            webbrowser.open(f"https:{href}" if href.startswith("//") else href)
+        Args:
+            href: The href of the link.
+        """
+        url, path = self._normalize_href(href)
+        
+        if url is not None:
+            self._open_external(url)
             return
         
-        path = self._normalize_href(href)
         if path is None:
             return
         
+        path = sys.intern(path)
         try:
             entry = self.archive.get_entry_by_path(path)
             title = entry.title or path
-            self.load_article(path, title)
+            self._display_entry(entry, title)
         except Exception:
-            self.content_view.update(f"# Not Found\n\nArticle not found: `{path}`")
+            self.content_view.update(message_content("Not Found", f"Article not found: {path}"))
+    
+    @work(thread=True, exit_on_error=False, group="browser")
+    def _open_external(self, url: str) -> None:
+        """Open a URL in the system browser without blocking the event loop.
+
+        Args:
+            url: The external URL to open.
+        """
+        webbrowser.open(url)
     
     def load_article(self, path: str, title: str) -> None:
         """Load and display an article.
@@ -408,61 +1284,271 @@ class ZimBrowser(App):
             path: The path to the article in the ZIM archive.
             title: The display title for the article.
         """
-        success = self._render_article(path, title)
-        
-        if success:
-            self._add_to_history(path, title)
+        self._render_article(path, title, add_to_history=True)
+    
+    def _display_entry(self, entry: Entry, title: str, add_to_history: bool = True) -> None:
+        """Load and display an already resolved entry without looking it up again.
+
+        Args:
+            entry: The entry to display.
+            title: The display title for the article.
+            add_to_history: Whether to record the article in history once shown.
+        """
+        self._render_article(entry.path, title, add_to_history, entry)
     
-    def _render_article(self, path: str, title: str) -> bool:
+    def _render_article(
+        self, path: str, title: str, add_to_history: bool = False, entry: Entry | None = None
+    ) -> None:
         """Render an article to the content view.
 
+        Cached articles are shown immediately; anything else is converted in
+        a background worker so the UI stays responsive.
+
         Args:
             path: The path to the article.
             title: The display title.
-
-        Returns:
-            True if article was rendered successfully, False otherwise.
+            add_to_history: Whether to record the article in history once shown.
+            entry: The entry at path, if the caller already has it.
         """
+        # Redirects resolved earlier map straight to their target's cache entry
+        if path in self._redirects:
+            self._redirects.move_to_end(path)
+            path, title = self._redirects[path]
+        if entry is not None and entry.path != path:
+            entry = None  # The caller's entry is the redirect alias
         if path in self._content_cache:
-            markdown_content = self._content_cache[path]
+            rendered = self._content_cache[path]
             self._content_cache.move_to_end(path)
-            self.content_view.update(markdown_content)
-            self.current_article = title
-            self.current_article_path = path
-            self.sub_title = title
-            return True
+            self._show_article(path, title, rendered, add_to_history, entry)
+            return
         
+        self.content_view.update(message_content(title, "Loading..."))
+        self._convert_article(path, title, add_to_history, entry)
+    
+    @work(exclusive=True, thread=True, group="render")
+    def _convert_article(self, path: str, title: str, add_to_history: bool, entry: Entry | None = None) -> None:
+        """Read and convert an article off the event loop, then display it.
+
+        Starting a new conversion cancels the previous one, so only the most
+        recently requested article is shown.
+
+        Args:
+            path: The path to the article.
+            title: The display title.
+            add_to_history: Whether to record the article in history once shown.
+            entry: The entry at path, if the caller already has it.
+        """
         try:
-            entry = self.archive.get_entry_by_path(path)
-            
-            if entry.is_redirect:
-                try:
-                    entry = entry.get_redirect_entry()
-                    title = entry.title or entry.path
-                except Exception as e:
-                    self.content_view.update(f"# Error\n\nFailed to follow redirect: {e}")
-                    return False
-            
-            item = entry.get_item()
-            content = item.content.tobytes()
-            
-            html_content = content.decode('utf-8', errors='replace')
-            markdown_content = md(html_content, heading_style="ATX")
-            
-            self._content_cache[path] = markdown_content
-            if len(self._content_cache) > MARKDOWN_CACHE_SIZE:
-                self._content_cache.popitem(last=False)
-            
-            self.content_view.update(markdown_content)
-            self.current_article = title
-            self.current_article_path = entry.path
-            self.sub_title = title
-            
-            return True
-            
+            entry, title, rendered = self._render_article_sync(path, title, entry)
         except Exception as e:
-            self.content_view.update(f"# Error\n\nFailed to load article: {e}")
-            return False
+            if not get_current_worker().is_cancelled:
+                self.call_from_thread(
+                    self.content_view.update, message_content("Error", f"Failed to load article: {e}")
+                )
+            return
+        
+        if get_current_worker().is_cancelled:
+            return
+        
+        if entry.path != path:
+            self.call_from_thread(self._remember_redirect, path, entry.path, title)
+        
+        self.call_from_thread(self._show_article, entry.path, title, rendered, add_to_history, entry)
+    
+    def _render_article_sync(
+        self, path: str, title: str, entry: Entry | None = None, prefetch: bool = False
+    ) -> tuple[Entry, str, Content]:
+        """Resolve an article and convert it for display.
+
+        This blocks on libzim and the HTML converter, so it's meant to run in
+        a worker thread. It doesn't touch any widgets.
+
+        Args:
+            path: The path to the article.
+            title: The display title.
+            entry: The entry at path, if the caller already has it.
+            prefetch: Whether the article is being prefetched rather than opened.
+
+        Returns:
+            A tuple of (entry after redirects, display title, rendered content).
+        """
+        if entry is None:
+            entry = self.archive.get_entry_by_path(path)
+        
+        if entry.is_redirect:
+            entry = resolve_redirects(entry)
+            title = entry.title or entry.path
+        
+        # Redirect aliases share the cache entry of their target
+        rendered = self._content_cache.get(entry.path)
+        if rendered is None:
+            rendered = self._convert_entry(entry, prefetch)
+        
+        return entry, title, rendered
+    
+    def _convert_entry(self, entry: Entry, prefetch: bool = False) -> Content:
+        """Convert an entry for display, in a render process when available.
+
+        Opening an article that is still being prefetched waits for that
+        conversion rather than starting a second one.
+
+        Args:
+            entry: A non-redirect entry.
+            prefetch: Whether the conversion is a prefetch rather than an open.
+
+        Returns:
+            The content to display for the entry's item.
+
+        Raises:
+            CancelledError: If a newer conversion superseded this one.
+        """
+        future, local = self._submit_conversion(entry.path, prefetch)
+        if local:
+            # A prefetch converting here still publishes its result, for an open to wait on
+            try:
+                item = entry.get_item()
+                rendered = item_to_content(item.mimetype, item.content)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            future.set_result(rendered)
+            return rendered
+        
+        if future is not None:
+            try:
+                return future.result()
+            except BrokenProcessPool:
+                self._render_pool_ready = False
+            except KeyError:
+                # The path doesn't resolve in the worker's archive; convert here instead
+                self.log.warning(f"Render worker couldn't find {entry.path}")
+        item = entry.get_item()
+        return item_to_content(item.mimetype, item.content)
+    
+    def _submit_conversion(self, path: str, prefetch: bool) -> tuple[Future[Content] | None, bool]:
+        """Start converting an entry, or join the prefetch already converting it.
+
+        Submitting a conversion cancels the previous one for the same pool if
+        it hasn't started yet, and opening an article also cancels a pending
+        prefetch of any other article, so superseded work doesn't hold up the
+        pools.
+
+        Args:
+            path: The path of a non-redirect entry.
+            prefetch: Whether the conversion is a prefetch rather than an open.
+
+        Returns:
+            A tuple of (future to wait on, or None to convert in the calling
+            thread; whether the caller must convert and complete the future).
+        """
+        future: Future[Content] | None = None
+        local = False
+        with self._pool_lock:
+            stale = [self._prefetch_future if prefetch else self._render_future]
+            if not prefetch and path == self._prefetch_path:
+                future = self._prefetch_future
+            else:
+                if not prefetch:
+                    stale.append(self._prefetch_future)
+                if self._render_pool_ready:
+                    pool = self._prefetch_pool if prefetch else self._render_pool
+                    try:
+                        # Only the path goes to the worker, which reads the item from its own archive
+                        future = pool.submit(_render_in_worker, path)
+                    except BrokenProcessPool:
+                        self._render_pool_ready = False
+                if future is None and prefetch:
+                    future = Future()
+                    future.set_running_or_notify_cancel()
+                    local = True
+            if prefetch:
+                self._prefetch_path, self._prefetch_future = path, future
+            else:
+                # An open owns the future it waits on, so newer prefetches can't cancel it
+                self._render_future = future
+                self._prefetch_path, self._prefetch_future = None, None
+        for old in stale:
+            if old is not None and old is not future:
+                old.cancel()
+        return future, local
+    
+    def prefetch_article(self, path: str) -> None:
+        """Render an article into the cache ahead of it being opened.
+
+        Args:
+            path: The path to the article.
+        """
+        path, _ = self._redirects.get(path, (path, ""))
+        if path not in self._content_cache:
+            self._prefetch_article(path)
+    
+    @work(exclusive=True, thread=True, group="prefetch")
+    def _prefetch_article(self, path: str) -> None:
+        """Convert an article off the event loop and cache the result.
+
+        Args:
+            path: The path to the article.
+        """
+        try:
+            entry, title, rendered = self._render_article_sync(path, "", prefetch=True)
+        except Exception:
+            return  # Prefetching is best-effort
+        
+        if get_current_worker().is_cancelled:
+            return
+        
+        # The caches are only modified on the event loop
+        if entry.path != path:
+            self.call_from_thread(self._remember_redirect, path, entry.path, title)
+        self.call_from_thread(self._cache_article, entry.path, rendered)
+    
+    def _remember_redirect(self, alias: str, path: str, title: str) -> None:
+        """Record where a redirect leads, evicting the least recently used.
+
+        Args:
+            alias: The redirect's path.
+            path: The path of the entry it resolves to.
+            title: The display title of that entry.
+        """
+        self._redirects[sys.intern(alias)] = (path, title)
+        self._redirects.move_to_end(alias)
+        if len(self._redirects) > RENDER_CACHE_SIZE:
+            self._redirects.popitem(last=False)
+    
+    def _cache_article(self, path: str, rendered: Content) -> None:
+        """Store converted article content, evicting the least recently used.
+
+        Args:
+            path: The path of the entry after redirects, used as the cache key.
+            rendered: The converted article content.
+        """
+        path = sys.intern(path)
+        self._content_cache[path] = rendered
+        self._content_cache.move_to_end(path)
+        if len(self._content_cache) > RENDER_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
+    
+    def _show_article(
+        self, path: str, title: str, rendered: Content, add_to_history: bool, entry: Entry | None = None
+    ) -> None:
+        """Display converted article content and update the related state.
+
+        Args:
+            path: The path of the displayed entry after redirects, used as the cache key.
+            title: The display title.
+            rendered: The converted article content.
+            add_to_history: Whether to record the article in history.
+            entry: The resolved entry at path, if known, kept in history.
+        """
+        self._cache_article(path, rendered)
+        
+        self.content_view.update(rendered)
+        self.current_article = title
+        self.current_article_path = path
+        self.sub_title = title
+        
+        if add_to_history:
+            self._add_to_history(path, title, entry)
     
     def action_focus_sidebar(self) -> None:
         """Focus the sidebar."""
@@ -486,40 +1572,43 @@ class ZimBrowser(App):
             entry = self.archive.get_random_entry()
             if entry:
                 title = entry.title or entry.path
-                self.load_article(entry.path, title)
+                self._display_entry(entry, title)
                 self.content_view.focus()
         except Exception as e:
-            self.content_view.update(f"# Error\n\nFailed to load random article: {e}")
+            self.content_view.update(message_content("Error", f"Failed to load random article: {e}"))
     
-    def _add_to_history(self, path: str, title: str) -> None:
+    def _add_to_history(self, path: str, title: str, entry: Entry | None = None) -> None:
         """Add an article to the browsing history.
 
         Args:
             path: The path to the article.
             title: The title of the article.
+            entry: The resolved entry at path, so revisiting it skips the lookup.
         """
-        if self.history_index < len(self.history) - 1:
-            self.history = self.history[:self.history_index + 1]
+        path = sys.intern(path)
+        # Drop the forward entries in place
+        while len(self.history) - 1 > self.history_index:
+            self.history.pop()
         
-        if self.history and self.history[-1] == (path, title):
+        if self.history and self.history[-1][:2] == (path, title):
             return
         
-        self.history.append((path, title))
+        self.history.append((path, title, entry))
         self.history_index = len(self.history) - 1
     
     def action_history_back(self) -> None:
         """Navigate to the previous article in history."""
         if self.history_index > 0:
             self.history_index -= 1
-            path, title = self.history[self.history_index]
-            self._render_article(path, title)
+            path, title, entry = self.history[self.history_index]
+            self._render_article(path, title, entry=entry)
     
     def action_history_forward(self) -> None:
         """Navigate to the next article in history."""
         if self.history_index < len(self.history) - 1:
             self.history_index += 1
-            path, title = self.history[self.history_index]
-            self._render_article(path, title)
+            path, title, entry = self.history[self.history_index]
+            self._render_article(path, title, entry=entry)
 
 
 def main() -> None:
@@ -537,14 +1626,9 @@ def main() -> None:
         print(f"Error: File '{zim_path}' not found.")
         sys.exit(1)
     
-    try:
-        archive = Archive(zim_file)
-    except Exception as e:
-        print(f"Error opening ZIM file: {e}")
-        sys.exit(1)
-    
-    app = ZimBrowser(archive)
+    app = ZimBrowser(zim_file)
     app.run()
+    sys.exit(app.return_code or 0)
 
 
 if __name__ == "__main__":